@@ -7,6 +7,7 @@ import (
 	"io"
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
 
 	"github.com/funkykay/summarize/internal/buildinfo"
@@ -24,6 +25,7 @@ type globalOptions struct {
 	baseDir string
 	profile string
 	dryRun  bool
+	jobs    int
 }
 
 func New(stdout io.Writer, stderr io.Writer) App {
@@ -38,7 +40,7 @@ func (a App) Run(args []string) int {
 	}
 
 	if command == "" {
-		if err := summary.Create(options.profile, options.baseDir, a.stdout, options.dryRun); err != nil {
+		if err := summary.Create(options.profile, options.baseDir, a.stdout, options.dryRun, options.jobs); err != nil {
 			fmt.Fprintf(a.stderr, "Error: %s\n", err)
 			return 1
 		}
@@ -145,7 +147,7 @@ func parseGlobalOptions(args []string) (globalOptions, string, []string, error)
 		return globalOptions{}, "", nil, err
 	}
 
-	options := globalOptions{baseDir: cwd}
+	options := globalOptions{baseDir: cwd, jobs: 1}
 
 	for i := 0; i < len(args); i++ {
 		arg := args[i]
@@ -168,6 +170,22 @@ func parseGlobalOptions(args []string) (globalOptions, string, []string, error)
 			options.profile = strings.TrimPrefix(arg, "--profile=")
 		case arg == "--dry-run":
 			options.dryRun = true
+		case arg == "--jobs":
+			if i+1 >= len(args) {
+				return globalOptions{}, "", nil, errors.New("--jobs requires a value")
+			}
+			jobs, err := parseJobs(args[i+1])
+			if err != nil {
+				return globalOptions{}, "", nil, err
+			}
+			options.jobs = jobs
+			i++
+		case strings.HasPrefix(arg, "--jobs="):
+			jobs, err := parseJobs(strings.TrimPrefix(arg, "--jobs="))
+			if err != nil {
+				return globalOptions{}, "", nil, err
+			}
+			options.jobs = jobs
 		case strings.HasPrefix(arg, "-"):
 			return globalOptions{}, "", nil, fmt.Errorf("unknown option: %s", arg)
 		default:
@@ -189,6 +207,15 @@ func parseGlobalOptions(args []string) (globalOptions, string, []string, error)
 	return options, "", nil, nil
 }
 
+func parseJobs(value string) (int, error) {
+	jobs, err := strconv.Atoi(value)
+	if err != nil || jobs < 1 {
+		return 0, fmt.Errorf("--jobs requires a positive integer, got: %s", value)
+	}
+
+	return jobs, nil
+}
+
 func resolveExistingDirectory(path string) (string, error) {
 	info, err := os.Stat(path)
 	if err != nil {
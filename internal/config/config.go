@@ -1,12 +1,16 @@
 package config
 
 import (
+	"cmp"
 	"encoding/json"
 	"errors"
 	"fmt"
 	"os"
 	"path/filepath"
+	"slices"
+	"strconv"
 	"strings"
+	"sync/atomic"
 )
 
 type Dict map[string]any
@@ -14,6 +18,7 @@ type Dict map[string]any
 type Config struct {
 	base   Dict
 	layers []Layer
+	paths  map[string][]string
 }
 
 type Layer struct {
@@ -21,6 +26,8 @@ type Layer struct {
 	Name string
 	Path string
 	Data Dict
+
+	sequence uint64
 }
 
 type LayerInfo struct {
@@ -29,7 +36,20 @@ type LayerInfo struct {
 	Path string
 }
 
-var layerIDCounter int
+const (
+	layerIDPrefix  = "layer-"
+	maxCachedPaths = 256
+)
+
+type pathState int
+
+const (
+	pathMissing pathState = iota
+	pathFound
+	pathShadowed
+)
+
+var layerIDCounter atomic.Uint64
 
 func New(base Dict) *Config {
 	copied := Dict{}
@@ -73,8 +93,8 @@ func (c *Config) PushLayer(path string) (string, bool, error) {
 }
 
 func (c *Config) PushDataLayer(data Dict, name string, path string) string {
-	layerIDCounter++
-	id := fmt.Sprintf("layer-%06d", layerIDCounter)
+	sequence := layerIDCounter.Add(1)
+	id := fmt.Sprintf("%s%06d", layerIDPrefix, sequence)
 
 	copied := Dict{}
 	for key, value := range data {
@@ -86,6 +106,8 @@ func (c *Config) PushDataLayer(data Dict, name string, path string) string {
 		Name: name,
 		Path: path,
 		Data: copied,
+
+		sequence: sequence,
 	})
 
 	return id
@@ -103,10 +125,15 @@ func (c *Config) PopLayer() (string, error) {
 }
 
 func (c *Config) RemoveLayer(layerID string) error {
-	for i, layer := range c.layers {
-		if layer.ID == layerID {
-			c.layers = append(c.layers[:i], c.layers[i+1:]...)
-			return nil
+	if digits, ok := strings.CutPrefix(layerID, layerIDPrefix); ok {
+		if sequence, err := strconv.ParseUint(digits, 10, 64); err == nil {
+			index, found := slices.BinarySearchFunc(c.layers, sequence, func(layer Layer, target uint64) int {
+				return cmp.Compare(layer.sequence, target)
+			})
+			if found && c.layers[index].ID == layerID {
+				c.layers = slices.Delete(c.layers, index, index+1)
+				return nil
+			}
 		}
 	}
 
@@ -131,8 +158,8 @@ func (c *Config) ListLayers() []LayerInfo {
 }
 
 func (c *Config) Get(dottedPath string, fallback any) any {
-	value, err := c.Require(dottedPath)
-	if err != nil {
+	value, found := c.lookup(dottedPath)
+	if !found {
 		return fallback
 	}
 
@@ -140,41 +167,130 @@ func (c *Config) Get(dottedPath string, fallback any) any {
 }
 
 func (c *Config) Require(dottedPath string) (any, error) {
+	if value, found := c.lookup(dottedPath); found {
+		return value, nil
+	}
+
+	if isSingleKey(dottedPath) {
+		return nil, fmt.Errorf("path not found: %q (missing key %q at level 0)", dottedPath, dottedPath)
+	}
+
+	keys, err := c.splitPath(dottedPath)
+	if err != nil {
+		return nil, err
+	}
+
+	return nil, c.pathError(dottedPath, keys)
+}
+
+func (c *Config) lookup(dottedPath string) (any, bool) {
+	if isSingleKey(dottedPath) {
+		return c.mergedKey(dottedPath)
+	}
+
+	keys, err := c.splitPath(dottedPath)
+	if err != nil {
+		return nil, false
+	}
+
+	return c.mergedValue(keys)
+}
+
+func (c *Config) splitPath(dottedPath string) ([]string, error) {
+	if keys, ok := c.paths[dottedPath]; ok {
+		return keys, nil
+	}
+
 	keys, err := splitPath(dottedPath)
 	if err != nil {
 		return nil, err
 	}
 
-	var node any = c.ToMap()
+	if c.paths == nil || len(c.paths) >= maxCachedPaths {
+		c.paths = map[string][]string{}
+	}
+	c.paths[dottedPath] = keys
+
+	return keys, nil
+}
+
+func (c *Config) mergedKey(key string) (any, bool) {
+	value, found := c.base[key]
+	for _, layer := range c.layers {
+		layerValue, exists := layer.Data[key]
+		if !exists {
+			continue
+		}
+
+		if found {
+			value = deepMerge(value, layerValue)
+		} else {
+			value = layerValue
+			found = true
+		}
+	}
+
+	return value, found
+}
+
+func (c *Config) mergedValue(keys []string) (any, bool) {
+	value, state := lookupPath(c.base, keys)
+	found := state == pathFound
+
+	for _, layer := range c.layers {
+		layerValue, layerState := lookupPath(layer.Data, keys)
+		switch layerState {
+		case pathFound:
+			if found {
+				value = deepMerge(value, layerValue)
+			} else {
+				value = layerValue
+				found = true
+			}
+		case pathShadowed:
+			value = nil
+			found = false
+		}
+	}
+
+	return value, found
+}
+
+func (c *Config) pathError(dottedPath string, keys []string) error {
+	var node any = c.mergedMap()
 	for depth, key := range keys {
 		object, ok := node.(Dict)
 		if !ok {
 			if generic, genericOK := node.(map[string]any); genericOK {
 				object = Dict(generic)
 			} else {
-				return nil, fmt.Errorf("path not found: %q (intermediate node is not an object/dict at level %d)", dottedPath, depth)
+				return fmt.Errorf("path not found: %q (intermediate node is not an object/dict at level %d)", dottedPath, depth)
 			}
 		}
 
 		value, exists := object[key]
 		if !exists {
-			return nil, fmt.Errorf("path not found: %q (missing key %q at level %d)", dottedPath, key, depth)
+			return fmt.Errorf("path not found: %q (missing key %q at level %d)", dottedPath, key, depth)
 		}
 		node = value
 	}
 
-	return node, nil
+	return fmt.Errorf("path not found: %q", dottedPath)
 }
 
 func (c *Config) Has(dottedPath string) bool {
-	_, err := c.Require(dottedPath)
-	return err == nil
+	_, found := c.lookup(dottedPath)
+	return found
 }
 
 func (c *Config) ToMap() Dict {
-	merged := cloneDict(c.base)
+	return c.mergedMap()
+}
+
+func (c *Config) mergedMap() Dict {
+	merged := cloneValue(c.base).(Dict)
 	for _, layer := range c.layers {
-		merged = deepMerge(merged, layer.Data).(Dict)
+		mergeInto(merged, layer.Data)
 	}
 
 	return merged
@@ -202,6 +318,28 @@ func loadJSON(path string) (Dict, error) {
 	return Dict(object), nil
 }
 
+func lookupPath(data Dict, keys []string) (any, pathState) {
+	var node any = data
+	for _, key := range keys {
+		object, ok := asDict(node)
+		if !ok {
+			return nil, pathShadowed
+		}
+
+		value, exists := object[key]
+		if !exists {
+			return nil, pathMissing
+		}
+		node = value
+	}
+
+	return node, pathFound
+}
+
+func isSingleKey(dottedPath string) bool {
+	return dottedPath != "" && !strings.Contains(dottedPath, ".") && strings.TrimSpace(dottedPath) == dottedPath
+}
+
 func splitPath(dottedPath string) ([]string, error) {
 	trimmed := strings.TrimSpace(dottedPath)
 	if trimmed == "" {
@@ -227,6 +365,13 @@ func deepMerge(base any, overlay any) any {
 	baseMap, baseIsMap := asDict(base)
 	overlayMap, overlayIsMap := asDict(overlay)
 	if baseIsMap && overlayIsMap {
+		if len(overlayMap) == 0 {
+			return baseMap
+		}
+		if len(baseMap) == 0 {
+			return overlayMap
+		}
+
 		result := cloneDict(baseMap)
 		for key, value := range overlayMap {
 			if existing, exists := result[key]; exists {
@@ -238,18 +383,67 @@ func deepMerge(base any, overlay any) any {
 		return result
 	}
 
-	baseList, baseIsList := asList(base)
-	overlayList, overlayIsList := asList(overlay)
+	baseLength, baseIsList := listLength(base)
+	overlayLength, overlayIsList := listLength(overlay)
 	if baseIsList && overlayIsList {
-		result := make([]any, 0, len(baseList)+len(overlayList))
-		result = append(result, baseList...)
-		result = append(result, overlayList...)
+		if overlayLength == 0 {
+			return base
+		}
+		if baseLength == 0 {
+			return overlay
+		}
+
+		result := make([]any, 0, baseLength+overlayLength)
+		result = appendList(result, base)
+		result = appendList(result, overlay)
 		return result
 	}
 
 	return overlay
 }
 
+func mergeInto(destination Dict, source Dict) {
+	for key, value := range source {
+		existing, exists := destination[key]
+		if !exists {
+			destination[key] = cloneValue(value)
+			continue
+		}
+
+		if existingMap, ok := existing.(Dict); ok {
+			if sourceMap, sourceIsMap := asDict(value); sourceIsMap {
+				mergeInto(existingMap, sourceMap)
+				continue
+			}
+		}
+
+		if existingList, ok := existing.([]any); ok {
+			if _, sourceIsList := listLength(value); sourceIsList {
+				destination[key] = appendList(existingList, value)
+				continue
+			}
+		}
+
+		destination[key] = cloneValue(value)
+	}
+}
+
+func cloneValue(value any) any {
+	if object, ok := asDict(value); ok {
+		result := make(Dict, len(object))
+		for key, entry := range object {
+			result[key] = cloneValue(entry)
+		}
+		return result
+	}
+
+	if length, ok := listLength(value); ok {
+		return appendList(make([]any, 0, length), value)
+	}
+
+	return value
+}
+
 func cloneDict(source Dict) Dict {
 	result := Dict{}
 	for key, value := range source {
@@ -270,19 +464,28 @@ func asDict(value any) (Dict, bool) {
 	}
 }
 
-func asList(value any) ([]any, bool) {
+func listLength(value any) (int, bool) {
 	switch typed := value.(type) {
 	case []any:
-		return typed, true
+		return len(typed), true
+	case []string:
+		return len(typed), true
+	default:
+		return 0, false
+	}
+}
+
+func appendList(destination []any, value any) []any {
+	switch typed := value.(type) {
+	case []any:
+		return append(destination, typed...)
 	case []string:
-		result := make([]any, 0, len(typed))
 		for _, entry := range typed {
-			result = append(result, entry)
+			destination = append(destination, entry)
 		}
-		return result, true
-	default:
-		return nil, false
 	}
+
+	return destination
 }
 
 func layerName(path string) string {
@@ -1,155 +1,225 @@
 package ignore
 
 import (
-	"os"
-	"path/filepath"
 	"regexp"
+	"strconv"
 	"strings"
+	"sync"
 )
 
-func GitignoreMatch(pattern string, pathString string, isDir bool) bool {
-	normalizedPattern := strings.TrimSpace(pattern)
-	if normalizedPattern == "" || strings.HasPrefix(normalizedPattern, "#") {
-		return false
-	}
+const maxCachedPatternLists = 8192
 
-	if strings.HasSuffix(normalizedPattern, "/") {
-		if !isDir {
-			return false
-		}
-		normalizedPattern = strings.TrimSuffix(normalizedPattern, "/")
-	}
+type Patterns struct {
+	files *regexp.Regexp
+	dirs  *regexp.Regexp
+}
 
-	if strings.HasPrefix(normalizedPattern, "/") {
-		anchored := strings.TrimPrefix(normalizedPattern, "/")
-		return pathString == anchored || strings.HasPrefix(pathString, anchored+"/")
-	}
+type PruneRules struct {
+	groups []pruneGroup
+}
 
-	parts := strings.Split(pathString, "/")
+type pruneGroup struct {
+	negated  bool
+	patterns Patterns
+}
 
-	if fnmatch(pathString, normalizedPattern) {
-		return true
-	}
+var compiledPatterns = struct {
+	sync.Mutex
+	entries map[string]Patterns
+}{entries: map[string]Patterns{}}
 
-	for i := range parts {
-		subpath := strings.Join(parts[i:], "/")
-		if fnmatch(subpath, normalizedPattern) {
-			return true
-		}
-		if fnmatch(parts[i], normalizedPattern) {
-			return true
-		}
+func CompilePatterns(patterns []string) Patterns {
+	if len(patterns) == 0 {
+		return Patterns{}
 	}
 
-	return false
-}
+	key := patternListKey(patterns)
 
-func GitignoreMatchWithDescendants(pattern string, pathString string, isDir bool) bool {
-	if GitignoreMatch(pattern, pathString, isDir) {
-		return true
-	}
+	compiledPatterns.Lock()
+	defer compiledPatterns.Unlock()
 
-	rawParts := strings.Split(pathString, "/")
-	parts := make([]string, 0, len(rawParts))
-	for _, part := range rawParts {
-		if part != "" {
-			parts = append(parts, part)
-		}
+	if compiled, ok := compiledPatterns.entries[key]; ok {
+		return compiled
 	}
 
-	upperBound := len(parts)
-	if !isDir {
-		upperBound = len(parts) - 1
+	compiled := compilePatterns(patterns)
+	if len(compiledPatterns.entries) >= maxCachedPatternLists {
+		clear(compiledPatterns.entries)
 	}
+	compiledPatterns.entries[key] = compiled
 
-	for i := 1; i <= upperBound; i++ {
-		ancestor := strings.Join(parts[:i], "/")
-		if ancestor == pathString {
-			continue
-		}
+	return compiled
+}
 
-		if GitignoreMatch(pattern, ancestor, true) {
-			return true
-		}
+func patternListKey(patterns []string) string {
+	var builder strings.Builder
+	for _, pattern := range patterns {
+		builder.WriteString(strconv.Itoa(len(pattern)))
+		builder.WriteByte(':')
+		builder.WriteString(pattern)
 	}
 
-	return false
+	return builder.String()
 }
 
-func MatchesAnyPattern(patterns []string, path string, basePath string, matchDescendants bool) bool {
-	pathString := relativeSlashPath(path, basePath)
-	isDir := isDirectory(path)
+func compilePatterns(patterns []string) Patterns {
+	var filePieces []string
+	var dirPieces []string
 
 	for _, pattern := range patterns {
-		if matchDescendants {
-			if GitignoreMatchWithDescendants(pattern, pathString, isDir) {
-				return true
-			}
+		piece, dirOnly, ok := patternExpression(pattern)
+		if !ok {
 			continue
 		}
 
-		if GitignoreMatch(pattern, pathString, isDir) {
-			return true
+		dirPieces = append(dirPieces, piece)
+		if !dirOnly {
+			filePieces = append(filePieces, piece)
 		}
 	}
 
-	return false
+	return Patterns{
+		files: compileAlternation(filePieces),
+		dirs:  compileAlternation(dirPieces),
+	}
 }
 
-func IsPruned(path string, basePath string, prunePatterns []string) bool {
-	if len(prunePatterns) == 0 {
-		return false
+func CompilePruneRules(prunePatterns []string) PruneRules {
+	var rules PruneRules
+	var current []string
+	currentNegated := false
+
+	flush := func() {
+		if len(current) > 0 {
+			rules.groups = append(rules.groups, pruneGroup{
+				negated:  currentNegated,
+				patterns: CompilePatterns(current),
+			})
+		}
+		current = nil
 	}
 
-	pathString := relativeSlashPath(path, basePath)
-	isDir := isDirectory(path)
-	pruned := false
-
 	for _, rawPattern := range prunePatterns {
 		pattern := strings.TrimSpace(rawPattern)
 		if pattern == "" || strings.HasPrefix(pattern, "#") {
 			continue
 		}
 
-		if strings.HasPrefix(pattern, "!") {
-			if GitignoreMatch(strings.TrimPrefix(pattern, "!"), pathString, isDir) {
-				pruned = false
-			}
-			continue
+		negated := strings.HasPrefix(pattern, "!")
+		if negated {
+			pattern = strings.TrimPrefix(pattern, "!")
 		}
 
-		if GitignoreMatch(pattern, pathString, isDir) {
-			pruned = true
+		if negated != currentNegated {
+			flush()
+			currentNegated = negated
 		}
+		current = append(current, pattern)
 	}
+	flush()
 
-	return pruned
+	return rules
 }
 
-func relativeSlashPath(path string, basePath string) string {
-	relativePath, err := filepath.Rel(basePath, path)
-	if err != nil || relativePath == ".." || strings.HasPrefix(relativePath, ".."+string(filepath.Separator)) {
-		relativePath = path
+func (p Patterns) Match(pathString string, isDir bool) bool {
+	expression := p.files
+	if isDir {
+		expression = p.dirs
 	}
 
-	return filepath.ToSlash(relativePath)
+	return expression != nil && expression.MatchString(pathString)
 }
 
-func isDirectory(path string) bool {
-	info, err := os.Stat(path)
-	return err == nil && info.IsDir()
+func (p Patterns) MatchWithDescendants(pathString string, isDir bool) bool {
+	if p.Match(pathString, isDir) {
+		return true
+	}
+	if p.dirs == nil {
+		return false
+	}
+
+	for i := 1; i < len(pathString); i++ {
+		if pathString[i] == '/' && p.dirs.MatchString(pathString[:i]) {
+			return true
+		}
+	}
+
+	return false
 }
 
-func fnmatch(name string, pattern string) bool {
-	expression, err := regexp.Compile("^" + translatePattern(pattern) + "$")
-	if err != nil {
+func (r PruneRules) Match(pathString string, isDir bool) bool {
+	for i := len(r.groups) - 1; i >= 0; i-- {
+		if r.groups[i].patterns.Match(pathString, isDir) {
+			return !r.groups[i].negated
+		}
+	}
+
+	return false
+}
+
+func MatchesAnyPattern(patterns Patterns, pathString string, isDir bool, matchDescendants bool) bool {
+	if matchDescendants {
+		return patterns.MatchWithDescendants(pathString, isDir)
+	}
+
+	return patterns.Match(pathString, isDir)
+}
+
+func IsPruned(pathString string, isDir bool, rules PruneRules) bool {
+	if len(rules.groups) == 0 {
 		return false
 	}
 
-	return expression.MatchString(name)
+	return rules.Match(pathString, isDir)
 }
 
-func translatePattern(pattern string) string {
+func patternExpression(pattern string) (string, bool, bool) {
+	normalizedPattern := strings.TrimSpace(pattern)
+	if normalizedPattern == "" || strings.HasPrefix(normalizedPattern, "#") {
+		return "", false, false
+	}
+
+	dirOnly := strings.HasSuffix(normalizedPattern, "/")
+	normalizedPattern = strings.TrimSuffix(normalizedPattern, "/")
+
+	var expression string
+	if strings.HasPrefix(normalizedPattern, "/") {
+		anchored := strings.TrimPrefix(normalizedPattern, "/")
+		expression = "^" + regexp.QuoteMeta(anchored) + "(?:/|$)"
+	} else {
+		if normalizedPattern == "" {
+			return "", false, false
+		}
+		if strings.Contains(normalizedPattern, "/") {
+			expression = "^(?:.*/)?(?:" + translatePattern(normalizedPattern, true) + ")$"
+		} else {
+			expression = "(?:^|/)(?:" + translatePattern(normalizedPattern, false) + ")(?:/|$)"
+		}
+	}
+
+	if _, err := regexp.Compile(expression); err != nil {
+		return "", false, false
+	}
+
+	return expression, dirOnly, true
+}
+
+func compileAlternation(pieces []string) *regexp.Regexp {
+	if len(pieces) == 0 {
+		return nil
+	}
+
+	return regexp.MustCompile("(?:" + strings.Join(pieces, ")|(?:") + ")")
+}
+
+func translatePattern(pattern string, crossSeparators bool) string {
+	anyRun := "[^/]*"
+	anyChar := "[^/]"
+	if crossSeparators {
+		anyRun = ".*"
+		anyChar = "."
+	}
+
 	var builder strings.Builder
 
 	for i := 0; i < len(pattern); i++ {
@@ -157,9 +227,9 @@ func translatePattern(pattern string) string {
 
 		switch char {
 		case '*':
-			builder.WriteString(".*")
+			builder.WriteString(anyRun)
 		case '?':
-			builder.WriteByte('.')
+			builder.WriteString(anyChar)
 		case '[':
 			end := i + 1
 			if end < len(pattern) && pattern[end] == '!' {
@@ -179,6 +249,9 @@ func translatePattern(pattern string) string {
 			content := pattern[i+1 : end]
 			if strings.HasPrefix(content, "!") {
 				content = "^" + regexp.QuoteMeta(content[1:])
+				if !crossSeparators {
+					content += "/"
+				}
 			} else {
 				content = regexp.QuoteMeta(content)
 			}
@@ -16,8 +16,8 @@ const (
 
 type TraversalSelection struct {
 	Mode    Mode
-	Include []string
-	Exclude []string
+	Include ignore.Patterns
+	Exclude ignore.Patterns
 }
 
 func ModeFromValue(value any) Mode {
@@ -38,14 +38,14 @@ func ModeFromValue(value any) Mode {
 func FromConfig(cfg *config.Config) TraversalSelection {
 	return TraversalSelection{
 		Mode:    ModeFromValue(cfg.Get("selection_mode", nil)),
-		Include: normalizePatterns(cfg.Get("include", []any{})),
-		Exclude: normalizePatterns(cfg.Get("exclude", []any{})),
+		Include: ignore.CompilePatterns(normalizePatterns(cfg.Get("include", []any{}))),
+		Exclude: ignore.CompilePatterns(normalizePatterns(cfg.Get("exclude", []any{}))),
 	}
 }
 
-func (s TraversalSelection) AllowsPath(path string, basePath string) bool {
-	explicitlyIncluded := ignore.MatchesAnyPattern(s.Include, path, basePath, true)
-	explicitlyExcluded := ignore.MatchesAnyPattern(s.Exclude, path, basePath, true)
+func (s TraversalSelection) AllowsPath(relativePath string, isDir bool) bool {
+	explicitlyIncluded := ignore.MatchesAnyPattern(s.Include, relativePath, isDir, true)
+	explicitlyExcluded := ignore.MatchesAnyPattern(s.Exclude, relativePath, isDir, true)
 
 	if s.Mode == ModeIncludeAll {
 		return explicitlyIncluded || !explicitlyExcluded
@@ -1,12 +1,15 @@
 package summary
 
 import (
+	"bytes"
 	"errors"
 	"fmt"
 	"io"
+	"io/fs"
 	"os"
 	"path/filepath"
-	"sort"
+	"slices"
+	"strings"
 	"unicode/utf8"
 
 	"github.com/funkykay/summarize/internal/config"
@@ -15,7 +18,26 @@ import (
 	"github.com/funkykay/summarize/internal/selection"
 )
 
-func Create(profileName string, baseDir string, writer io.Writer, dryRun bool) error {
+const binarySniffSize = 4096
+
+type walker struct {
+	cfg    *config.Config
+	writer io.Writer
+	dryRun bool
+	jobs   int
+}
+
+type selectedFile struct {
+	path         string
+	relativePath string
+}
+
+type traversalRules struct {
+	prune     ignore.PruneRules
+	selection selection.TraversalSelection
+}
+
+func Create(profileName string, baseDir string, writer io.Writer, dryRun bool, jobs int) error {
 	resolvedBaseDir, err := filepath.Abs(baseDir)
 	if err != nil {
 		return err
@@ -27,103 +49,218 @@ func Create(profileName string, baseDir string, writer io.Writer, dryRun bool) e
 	}
 	profile.ApplyLayer(cfg, profileName)
 
-	return Directory(resolvedBaseDir, cfg, resolvedBaseDir, writer, false, dryRun)
+	return Directory(resolvedBaseDir, cfg, resolvedBaseDir, writer, false, dryRun, jobs)
 }
 
-func Directory(directory string, cfg *config.Config, basePath string, writer io.Writer, loadConfigLayer bool, dryRun bool) error {
-	layerPushed := false
-
-	if loadConfigLayer {
-		_, pushed, err := cfg.PushLayer(filepath.Join(directory, "summarize.json"))
-		if err != nil {
-			return err
-		}
-		layerPushed = pushed
+func Directory(directory string, cfg *config.Config, basePath string, writer io.Writer, loadConfigLayer bool, dryRun bool, jobs int) error {
+	relativePath, err := filepath.Rel(basePath, directory)
+	if err != nil {
+		relativePath = directory
+	}
+	relativePath = filepath.ToSlash(relativePath)
+	if relativePath == "." {
+		relativePath = ""
 	}
 
-	defer func() {
-		if layerPushed {
-			_, _ = cfg.PopLayer()
-		}
-	}()
+	w := walker{cfg: cfg, writer: writer, dryRun: dryRun, jobs: jobs}
+	return w.traverse(directory, relativePath, loadConfigLayer, nil)
+}
 
+func (w walker) traverse(directory string, relativePath string, loadConfigLayer bool, inherited *traversalRules) error {
 	entries, err := os.ReadDir(directory)
 	if err != nil {
 		if errors.Is(err, os.ErrPermission) {
-			if dryRun {
+			if w.dryRun {
 				return nil
 			}
 
-			relativePath, relErr := filepath.Rel(basePath, directory)
-			if relErr != nil {
-				relativePath = directory
+			displayPath := relativePath
+			if displayPath == "" {
+				displayPath = "."
 			}
-			fmt.Fprintf(writer, "[Access denied: %s]\n", filepath.ToSlash(relativePath))
+			fmt.Fprintf(w.writer, "[Access denied: %s]\n", displayPath)
 			return nil
 		}
 		return err
 	}
 
-	sort.Slice(entries, func(i, j int) bool {
-		return entries[i].Name() < entries[j].Name()
-	})
+	layerPushed := false
+
+	if loadConfigLayer && hasConfigFile(entries) {
+		_, pushed, err := w.cfg.PushLayer(filepath.Join(directory, "summarize.json"))
+		if err != nil {
+			return err
+		}
+		layerPushed = pushed
+	}
+
+	defer func() {
+		if layerPushed {
+			_, _ = w.cfg.PopLayer()
+		}
+	}()
 
-	prunePatterns := normalizePatterns(cfg.Get("prune", []any{}))
-	traversalSelection := selection.FromConfig(cfg)
+	rules := inherited
+	if rules == nil || layerPushed {
+		rules = rulesFromConfig(w.cfg)
+	}
+
+	directoryPrefix := directory
+	if !strings.HasSuffix(directoryPrefix, string(filepath.Separator)) {
+		directoryPrefix += string(filepath.Separator)
+	}
+	relativePrefix := ""
+	if relativePath != "" {
+		relativePrefix = relativePath + "/"
+	}
 
+	var files []selectedFile
 	for _, entry := range entries {
-		itemPath := filepath.Join(directory, entry.Name())
-		if ignore.IsPruned(itemPath, basePath, prunePatterns) {
+		name := entry.Name()
+		itemPath := directoryPrefix + name
+		itemRelativePath := relativePrefix + name
+		isDir := entry.IsDir()
+		matchAsDir := isDir
+		if entry.Type()&fs.ModeSymlink != 0 {
+			if info, err := os.Stat(itemPath); err == nil {
+				matchAsDir = info.IsDir()
+			}
+		}
+		if ignore.IsPruned(itemRelativePath, matchAsDir, rules.prune) {
 			continue
 		}
 
-		info, err := entry.Info()
-		if err != nil {
-			return err
-		}
+		if isDir {
+			w.printFiles(files)
+			files = files[:0]
 
-		if info.IsDir() {
-			if err := Directory(itemPath, cfg, basePath, writer, true, dryRun); err != nil {
+			if err := w.traverse(itemPath, itemRelativePath, true, rules); err != nil {
 				return err
 			}
 			continue
 		}
 
-		if !traversalSelection.AllowsPath(itemPath, basePath) {
+		if !rules.selection.AllowsPath(itemRelativePath, matchAsDir) {
 			continue
 		}
 
-		relativePath, err := filepath.Rel(basePath, itemPath)
-		if err != nil {
-			relativePath = itemPath
-		}
-
-		if dryRun {
-			fmt.Fprintln(writer, filepath.ToSlash(relativePath))
+		if w.dryRun {
+			fmt.Fprintln(w.writer, itemRelativePath)
 			continue
 		}
 
-		fmt.Fprintf(writer, "=== %s ===\n", filepath.ToSlash(relativePath))
-		printFileContent(writer, itemPath)
-		fmt.Fprintln(writer)
+		files = append(files, selectedFile{path: itemPath, relativePath: itemRelativePath})
 	}
+	w.printFiles(files)
 
 	return nil
 }
 
+func (w walker) printFiles(files []selectedFile) {
+	if w.jobs <= 1 || len(files) <= 1 {
+		for _, file := range files {
+			fmt.Fprintf(w.writer, "=== %s ===\n", file.relativePath)
+			printFileContent(w.writer, file.path)
+			fmt.Fprintln(w.writer)
+		}
+		return
+	}
+
+	contents := make([]chan []byte, len(files))
+	for i := range contents {
+		contents[i] = make(chan []byte, 1)
+	}
+
+	slots := make(chan struct{}, w.jobs)
+	go func() {
+		for i, file := range files {
+			slots <- struct{}{}
+			go func(content chan<- []byte, path string) {
+				var buffer bytes.Buffer
+				printFileContent(&buffer, path)
+				content <- buffer.Bytes()
+			}(contents[i], file.path)
+		}
+	}()
+
+	for i, file := range files {
+		content := <-contents[i]
+		fmt.Fprintf(w.writer, "=== %s ===\n", file.relativePath)
+		_, _ = w.writer.Write(content)
+		fmt.Fprintln(w.writer)
+		<-slots
+	}
+}
+
+func hasConfigFile(entries []os.DirEntry) bool {
+	index, found := slices.BinarySearchFunc(entries, "summarize.json", func(entry os.DirEntry, name string) int {
+		return strings.Compare(entry.Name(), name)
+	})
+
+	return found && !entries[index].IsDir()
+}
+
+func rulesFromConfig(cfg *config.Config) *traversalRules {
+	return &traversalRules{
+		prune:     ignore.CompilePruneRules(normalizePatterns(cfg.Get("prune", []any{}))),
+		selection: selection.FromConfig(cfg),
+	}
+}
+
 func printFileContent(writer io.Writer, path string) {
-	content, err := os.ReadFile(path)
+	file, err := os.Open(path)
 	if err != nil {
 		fmt.Fprintf(writer, "[Error reading file: %s]\n", err)
 		return
 	}
+	defer file.Close()
+
+	head := make([]byte, binarySniffSize+1)
+	n, err := io.ReadFull(file, head)
+	if err != nil && !errors.Is(err, io.EOF) && !errors.Is(err, io.ErrUnexpectedEOF) {
+		fmt.Fprintf(writer, "[Error reading file: %s]\n", err)
+		return
+	}
+	head = head[:n]
 
-	if !utf8.Valid(content) {
+	complete := n <= binarySniffSize
+	if looksBinary(head[:min(n, binarySniffSize)], complete) {
 		fmt.Fprintln(writer, "[Binary file - content not displayable]")
 		return
 	}
 
-	fmt.Fprintln(writer, string(content))
+	_, _ = writer.Write(head)
+	if _, err := io.Copy(writer, file); err != nil {
+		fmt.Fprintf(writer, "\n[Error reading file: %s]\n", err)
+		return
+	}
+
+	fmt.Fprintln(writer)
+}
+
+func looksBinary(sniff []byte, complete bool) bool {
+	if bytes.IndexByte(sniff, 0) >= 0 {
+		return true
+	}
+	if !complete {
+		sniff = sniff[:len(sniff)-incompleteRuneLength(sniff)]
+	}
+
+	return !utf8.Valid(sniff)
+}
+
+func incompleteRuneLength(data []byte) int {
+	for length := 1; length <= utf8.UTFMax && length <= len(data); length++ {
+		start := len(data) - length
+		if utf8.RuneStart(data[start]) {
+			if utf8.FullRune(data[start:]) {
+				return 0
+			}
+			return length
+		}
+	}
+
+	return 0
 }
 
 func normalizePatterns(value any) []string {
@@ -98,3 +98,21 @@ func TestInvalidBaseDirReturnsError(t *testing.T) {
 		t.Fatalf("expected missing directory error, got %q", stderr.String())
 	}
 }
+
+func TestInvalidJobsValueReturnsError(t *testing.T) {
+	baseDir := t.TempDir()
+	var stdout bytes.Buffer
+	var stderr bytes.Buffer
+
+	exitCode := cli.New(&stdout, &stderr).Run([]string{"--base-dir", baseDir, "--jobs", "0"})
+
+	if exitCode != 1 {
+		t.Fatalf("expected exit code 1, got %d", exitCode)
+	}
+	if stdout.String() != "" {
+		t.Fatalf("expected empty stdout, got %q", stdout.String())
+	}
+	if !strings.Contains(stderr.String(), "--jobs requires a positive integer") {
+		t.Fatalf("expected jobs validation error, got %q", stderr.String())
+	}
+}
@@ -1,6 +1,12 @@
 package summarize_test
 
-import "testing"
+import (
+	"os"
+	"path/filepath"
+	"runtime"
+	"strings"
+	"testing"
+)
 
 func TestAppliesLayeredSummarizeJSONPrune(t *testing.T) {
 	root := t.TempDir()
@@ -49,6 +55,45 @@ func TestNegationPatternReincludesFile(t *testing.T) {
 	validator.AssertFileContent(t, "important.log", "show\n")
 }
 
+func TestLaterPrunePatternOverridesEarlierNegation(t *testing.T) {
+	root := t.TempDir()
+	newFileTree().
+		JSONFile("summarize.json", map[string]any{"prune": []string{"*.log", "!*.log", "debug.log"}}).
+		File("app.log", "show\n").
+		File("debug.log", "skip\n").
+		Create(t, root)
+
+	output := runSummarize(t, root)
+	validator := newSummarizeOutputValidator(t, output)
+
+	validator.AssertPaths(t, []string{"app.log", "summarize.json"})
+	validator.AssertNotContainsFile(t, "debug.log")
+	validator.AssertFileContent(t, "app.log", "show\n")
+}
+
+func TestSlashFreeWildcardsDoNotCrossDirectories(t *testing.T) {
+	root := t.TempDir()
+	newFileTree().
+		JSONFile("summarize.json", map[string]any{"prune": []string{"b*.go", "docs/*.md"}}).
+		File("bar.go", "skip\n").
+		File("build/a.go", "keep\n").
+		File("build/b.go", "skip\n").
+		File("docs/guide.md", "skip\n").
+		File("nested/docs/intro.md", "skip\n").
+		File("nested/readme.md", "keep\n").
+		Create(t, root)
+
+	output := runSummarize(t, root)
+	validator := newSummarizeOutputValidator(t, output)
+
+	validator.AssertPaths(t, []string{"build/a.go", "nested/readme.md", "summarize.json"})
+	validator.AssertNotContainsFile(t, "bar.go")
+	validator.AssertNotContainsFile(t, "build/b.go")
+	validator.AssertNotContainsFile(t, "docs/guide.md")
+	validator.AssertNotContainsFile(t, "nested/docs/intro.md")
+	validator.AssertFileContent(t, "build/a.go", "keep\n")
+}
+
 func TestNestedSummarizeJSONOnlyAppliesBelowItsDirectory(t *testing.T) {
 	root := t.TempDir()
 	newFileTree().
@@ -109,3 +154,42 @@ func TestDirectoryPatternWithoutAnchorMatchesNestedDirectories(t *testing.T) {
 	validator.AssertNotContainsFile(t, "src/build/generated.txt")
 	validator.AssertFileContent(t, "src/app.py", "print('ok')\n")
 }
+
+func TestSymlinkedDirectoryIsMatchedAsDirectory(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("creating symlinks requires extra privileges on Windows")
+	}
+
+	cases := []struct {
+		name     string
+		prune    []string
+		expected []string
+	}{
+		{name: "directory pattern", prune: []string{"real/", "linked/"}, expected: []string{""}},
+		{name: "name pattern", prune: []string{"real/", "linked"}, expected: []string{""}},
+		{name: "unmatched", prune: []string{"real/"}, expected: []string{"linked", ""}},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			root := t.TempDir()
+			newFileTree().
+				JSONFile("summarize.json", map[string]any{"exclude": []string{"summarize.json"}, "prune": tc.prune}).
+				File("real/inner.txt", "inner\n").
+				Create(t, root)
+			if err := os.Symlink("real", filepath.Join(root, "linked")); err != nil {
+				t.Fatalf("create symlink: %v", err)
+			}
+
+			result := runCLIProcess(t, root, "--dry-run")
+
+			if result.ExitCode != 0 {
+				t.Fatalf("expected exit code 0, got %d with stderr %q", result.ExitCode, result.Stderr)
+			}
+			expected := strings.Join(tc.expected, "\n")
+			if result.Stdout != expected {
+				t.Fatalf("unexpected stdout: expected %q, got %q", expected, result.Stdout)
+			}
+		})
+	}
+}
@@ -0,0 +1,135 @@
+package summarize_test
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"runtime"
+	"strings"
+	"testing"
+)
+
+func TestPrintsLargeUTF8FileContent(t *testing.T) {
+	content := strings.Repeat("größe ✓ ", 20000)
+	root := t.TempDir()
+	newFileTree().
+		JSONFile("summarize.json", map[string]any{"exclude": []string{"summarize.json"}}).
+		File("large.txt", content).
+		Create(t, root)
+
+	output := runSummarize(t, root)
+	validator := newSummarizeOutputValidator(t, output)
+
+	validator.AssertPaths(t, []string{"large.txt"})
+	validator.AssertFileContent(t, "large.txt", content)
+}
+
+func TestPrintsBinaryPlaceholderForInvalidUTF8(t *testing.T) {
+	root := t.TempDir()
+	newFileTree().
+		JSONFile("summarize.json", map[string]any{"exclude": []string{"summarize.json"}}).
+		BinaryFile("image.bin", 128).
+		File("text.txt", "text\n").
+		Create(t, root)
+
+	output := runSummarize(t, root)
+	validator := newSummarizeOutputValidator(t, output)
+
+	validator.AssertPaths(t, []string{"image.bin", "text.txt"})
+	validator.AssertFileContent(t, "image.bin", "[Binary file - content not displayable]")
+	validator.AssertFileContent(t, "text.txt", "text\n")
+}
+
+func TestPrintsBinaryPlaceholderForFileWithNULByte(t *testing.T) {
+	root := t.TempDir()
+	newFileTree().
+		JSONFile("summarize.json", map[string]any{"exclude": []string{"summarize.json"}}).
+		File("data.dat", "header\x00payload").
+		Create(t, root)
+
+	output := runSummarize(t, root)
+	validator := newSummarizeOutputValidator(t, output)
+
+	validator.AssertPaths(t, []string{"data.dat"})
+	validator.AssertFileContent(t, "data.dat", "[Binary file - content not displayable]")
+}
+
+func TestBinarySniffBoundary(t *testing.T) {
+	truncatedAtEOF := strings.Repeat("a", 4095) + "\xe2"
+	runeAcrossBoundary := strings.Repeat("a", 4095) + "é tail\n"
+	exactSize := strings.Repeat("a", 4096)
+	root := t.TempDir()
+	newFileTree().
+		JSONFile("summarize.json", map[string]any{"exclude": []string{"summarize.json"}}).
+		File("across.txt", runeAcrossBoundary).
+		File("exact.txt", exactSize).
+		File("truncated.txt", truncatedAtEOF).
+		Create(t, root)
+
+	output := runSummarize(t, root)
+	validator := newSummarizeOutputValidator(t, output)
+
+	validator.AssertPaths(t, []string{"across.txt", "exact.txt", "truncated.txt"})
+	validator.AssertFileContent(t, "across.txt", runeAcrossBoundary)
+	validator.AssertFileContent(t, "exact.txt", exactSize)
+	validator.AssertFileContent(t, "truncated.txt", "[Binary file - content not displayable]")
+}
+
+func TestParallelJobsKeepOutputOrder(t *testing.T) {
+	root := t.TempDir()
+	tree := newFileTree().
+		JSONFile("summarize.json", map[string]any{"prune": []string{"skipped/"}}).
+		BinaryFile("b/image.bin", 64).
+		File("skipped/never.txt", "never\n")
+	for i := 0; i < 20; i++ {
+		tree.File(fmt.Sprintf("a/file-%02d.txt", i), fmt.Sprintf("a %d\n", i))
+		tree.File(fmt.Sprintf("b/file-%02d.txt", i), strings.Repeat(fmt.Sprintf("b %d\n", i), 1000))
+		tree.File(fmt.Sprintf("top-%02d.txt", i), fmt.Sprintf("top %d\n", i))
+	}
+	tree.Create(t, root)
+
+	sequential := runSummarize(t, root)
+	parallel := runSummarize(t, root, "--jobs", "4")
+
+	if parallel != sequential {
+		t.Fatalf("expected parallel output to match sequential output")
+	}
+	validator := newSummarizeOutputValidator(t, parallel)
+	validator.AssertContainsFile(t, "a/file-00.txt")
+	validator.AssertNotContainsFile(t, "skipped/never.txt")
+	validator.AssertFileContent(t, "b/image.bin", "[Binary file - content not displayable]")
+}
+
+func TestUnreadableDirectoryPrintsAccessDeniedMarker(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("directory permissions are not enforced on Windows")
+	}
+	if os.Geteuid() == 0 {
+		t.Skip("directory permissions are not enforced for root")
+	}
+
+	root := t.TempDir()
+	newFileTree().
+		JSONFile("summarize.json", map[string]any{"exclude": []string{"summarize.json"}}).
+		File("locked/secret.txt", "secret\n").
+		File("visible.txt", "visible\n").
+		Create(t, root)
+
+	locked := filepath.Join(root, "locked")
+	if err := os.Chmod(locked, 0o000); err != nil {
+		t.Fatalf("chmod locked directory: %v", err)
+	}
+	t.Cleanup(func() {
+		_ = os.Chmod(locked, 0o755)
+	})
+
+	result := runCLIProcess(t, root)
+
+	if result.ExitCode != 0 {
+		t.Fatalf("expected exit code 0, got %d with stderr %q", result.ExitCode, result.Stderr)
+	}
+	expected := "[Access denied: locked]\n=== visible.txt ===\nvisible\n\n\n"
+	if result.Stdout != expected {
+		t.Fatalf("unexpected stdout: expected %q, got %q", expected, result.Stdout)
+	}
+}
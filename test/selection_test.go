@@ -110,3 +110,19 @@ func TestNestedSummarizeJSONIsLoadedEvenWhenParentDirectoryIsNotSelected(t *test
 	validator.AssertFileContent(t, "secret/revealed.txt", "revealed\n")
 	validator.AssertFileContent(t, "visible.txt", "visible\n")
 }
+
+func TestDirectoryNamedSummarizeJSONIsTraversedAsDirectory(t *testing.T) {
+	root := t.TempDir()
+	newFileTree().
+		JSONFile("summarize.json", map[string]any{"exclude": []string{"/summarize.json"}}).
+		File("sub/summarize.json/inner.txt", "inner\n").
+		File("sub/visible.txt", "visible\n").
+		Create(t, root)
+
+	output := runSummarize(t, root)
+	validator := newSummarizeOutputValidator(t, output)
+
+	validator.AssertPaths(t, []string{"sub/summarize.json/inner.txt", "sub/visible.txt"})
+	validator.AssertFileContent(t, "sub/summarize.json/inner.txt", "inner\n")
+	validator.AssertFileContent(t, "sub/visible.txt", "visible\n")
+}